@@ -5,79 +5,204 @@ Generates publication-ready charts for academic report
 Works with summary-only data (no detailed CSV required)
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import argparse
+import csv
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+import os
 import sys
 
-# Set style for academic papers
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 6)
-plt.rcParams['font.size'] = 11
-plt.rcParams['font.family'] = 'serif'
+# Canonical tier ordering, display labels and colors used by every chart and table
+TIER_ORDER = ('baseline', 'zeroTrust', 'contextAware', 'privacyPreserving')
+TIER_LABELS = ('Baseline', 'Zero Trust', 'Context-Aware', 'Privacy-Preserving')
+TIER_COLORS = ('#2ecc71', '#3498db', '#f39c12', '#e74c3c')
+TIER_INDEX = {tier: i for i, tier in enumerate(TIER_ORDER)}
+METRIC_COLS = ['Average', 'Median', 'P95', 'P99', 'Min', 'Max']
+
+# Figure file formats written for each --format choice
+OUTPUT_FORMATS = {
+    'png': ('png',),
+    'pdf': ('pdf',),
+    'both': ('png', 'pdf'),
+}
+
+def _is_number(value):
+    """Whether a CSV cell parses as a float"""
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        return False
+    return True
 
 def load_data(summary_file):
-    """Load benchmark results from CSV file"""
+    """Load benchmark results as {tier: {column: value}} (cached until the file changes)
+
+    Each call returns the caller's own copy, so editing it (e.g. before
+    passing it to main()) never alters the cached parse.
+    """
+    # Key on the resolved path so a relative name is not confused across
+    # chdir, and on mtime + size to catch rewrites within one mtime tick
+    path = os.path.realpath(summary_file)
+    stat = os.stat(path)
+    cached = _read_summary(path, stat.st_mtime_ns, stat.st_size)
+    return {tier: dict(cols) for tier, cols in cached.items()}
+
+@lru_cache(maxsize=8)
+def _read_summary(summary_file, mtime_ns, size):
+    """Parse the summary CSV; mtime_ns and size are only part of the cache key"""
     print(f"📥 Loading data from: {summary_file}")
-    summary = pd.read_csv(summary_file)
-    
-    # Validate required columns
-    required_cols = ['Tier', 'Average', 'Median', 'P95', 'P99', 'Min', 'Max']
-    missing_cols = [col for col in required_cols if col not in summary.columns]
-    
-    if missing_cols:
-        print(f"❌ Error: Missing required columns: {missing_cols}")
-        print(f"   Found columns: {summary.columns.tolist()}")
-        sys.exit(1)
-    
-    print(f"✅ Loaded {len(summary)} tiers")
-    return summary
+    with open(summary_file, newline='') as f:
+        reader = csv.DictReader(f)
+        columns = reader.fieldnames or []
+        
+        # Validate required columns
+        required_cols = ['Tier'] + METRIC_COLS
+        missing_cols = [col for col in required_cols if col not in columns]
+        
+        if missing_cols:
+            print(f"❌ Error: Missing required columns: {missing_cols}")
+            print(f"   Found columns: {columns}")
+            sys.exit(1)
+        
+        # The summary is at most one row per tier, so a plain dict of
+        # floats keyed by tier name gives O(1) lookups with no table scans
+        tier_rows = {}
+        for row in reader:
+            tier = row['Tier']
+            if tier in tier_rows:
+                print(f"❌ Error: Duplicate rows for tier '{tier}'")
+                sys.exit(1)
+            try:
+                tier_rows[tier] = {col: float(row[col]) for col in METRIC_COLS}
+            except (TypeError, ValueError):
+                bad_cols = [col for col in METRIC_COLS if not _is_number(row[col])]
+                print(f"❌ Error: Non-numeric value for tier '{tier}' in column(s): {bad_cols}")
+                sys.exit(1)
+    
+    print(f"✅ Loaded {len(tier_rows)} tiers")
+    return tier_rows
 
-def create_average_latency_comparison(summary, output_dir):
-    """Create bar chart comparing average latency across tiers"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Define colors for each tier
-    colors = ['#2ecc71', '#3498db', '#f39c12', '#e74c3c']
-    tier_labels = ['Baseline', 'Zero Trust', 'Context-Aware', 'Privacy-Preserving']
-    
-    # Map tier names to labels
-    tier_name_map = {
-        'baseline': 'Baseline',
-        'zeroTrust': 'Zero Trust',
-        'contextAware': 'Context-Aware',
-        'privacyPreserving': 'Privacy-Preserving'
-    }
-    
-    # Create ordered data
-    ordered_data = []
-    for tier in ['baseline', 'zeroTrust', 'contextAware', 'privacyPreserving']:
-        row = summary[summary['Tier'] == tier]
-        if len(row) > 0:
-            ordered_data.append(row['Average'].values[0])
+def _configure_plotting():
+    """Import and style matplotlib/seaborn (deferred until there is data to plot)"""
+    # Output is file-only, so skip loading an interactive GUI backend
+    # (seaborn imports pyplot, which would otherwise pick one)
+    import matplotlib
+    matplotlib.use('Agg')
+    import seaborn as sns
+    
+    # Set style for academic papers
+    sns.set_style("whitegrid")
+    matplotlib.rcParams['figure.figsize'] = (12, 6)
+    matplotlib.rcParams['font.size'] = 11
+    matplotlib.rcParams['font.family'] = 'serif'
+
+@dataclass
+class PlotData:
+    """Per-tier arrays (in TIER_ORDER) and derived values shared by all charts"""
+    avgs: np.ndarray
+    medians: np.ndarray
+    p95s: np.ndarray
+    p99s: np.ndarray
+    mins: np.ndarray
+    maxs: np.ndarray
+    present: np.ndarray
+    throughput: np.ndarray
+    overheads: np.ndarray
+    zt_overhead: float
+    ca_change: float
+    privacy_overhead: float
+
+def _save_figure(fig, output_dir, name, formats, dpi):
+    """Save a finished figure in each requested format"""
+    # Every savefig re-renders the whole figure through its backend, so
+    # skipping the PDF roughly halves the cost of each chart
+    for ext in formats:
+        if ext == 'png':
+            # Fastest DEFLATE level: quicker to encode at the cost of larger files
+            fig.savefig(f'{output_dir}/{name}.png', dpi=dpi, bbox_inches='tight',
+                        pil_kwargs={'compress_level': 1})
         else:
-            print(f"⚠️  Warning: Missing data for tier '{tier}'")
-            ordered_data.append(0)
+            # Vector output: dpi only affects embedded rasters
+            fig.savefig(f'{output_dir}/{name}.{ext}', bbox_inches='tight')
+    print(f"✅ Generated: {', '.join(f'{name}.{ext}' for ext in formats)}")
+
+@lru_cache(maxsize=1)
+def _shared_figure():
+    """Figure reused by every chart rendered in this process"""
+    # Drawn directly on an Agg canvas; pyplot's figure manager is not needed
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig
+
+def _render(plot, data, output_dir, formats, dpi):
+    """Draw one chart onto this process's shared figure"""
+    plot(_shared_figure(), data, output_dir, formats, dpi)
+
+def build_plot_data(tier_rows):
+    """Compute every array the charts need in a single pass over the tier rows"""
+    # One column per tier, placed by index; tiers absent from the data
+    # stay zero-filled (so they plot as zero) and are flagged in `present`
+    table = np.zeros((len(METRIC_COLS), len(TIER_ORDER)))
+    present = np.zeros(len(TIER_ORDER), dtype=bool)
+    for tier, row in tier_rows.items():
+        idx = TIER_INDEX.get(tier)
+        if idx is not None:
+            table[:, idx] = [row[col] for col in METRIC_COLS]
+            present[idx] = True
+    avgs, medians, p95s, p99s, mins, maxs = table
+    
+    if not present.all():
+        missing = [tier for tier, ok in zip(TIER_ORDER, present) if not ok]
+        print(f"⚠️  Warning: Missing data for tier(s): {', '.join(missing)}")
+    
+    # Throughput as 1000 / avg_latency (requests per second)
+    throughput = np.divide(1000.0, avgs, out=np.zeros_like(avgs), where=avgs > 0)
+    
+    # Overhead relative to baseline is undefined without a positive baseline
+    if present[0] and avgs[0] > 0:
+        overheads = (avgs - avgs[0]) / avgs[0] * 100
+    else:
+        overheads = np.full_like(avgs, np.nan)
+    
+    return PlotData(
+        avgs=avgs, medians=medians, p95s=p95s, p99s=p99s, mins=mins, maxs=maxs,
+        present=present,
+        throughput=throughput,
+        overheads=overheads,
+        zt_overhead=avgs[1] - avgs[0],
+        ca_change=avgs[2] - avgs[1],
+        privacy_overhead=avgs[3] - avgs[2],
+    )
+
+def create_average_latency_comparison(fig, data, output_dir, formats, dpi):
+    """Create bar chart comparing average latency across tiers"""
+    fig.clear()
+    fig.set_size_inches(10, 6)
+    ax = fig.add_subplot(111)
+    
+    ordered_data = data.avgs
+    x = np.arange(len(TIER_LABELS))
     
-    bars = ax.bar(tier_labels, ordered_data, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
+    ax.bar(TIER_LABELS, ordered_data, color=TIER_COLORS, alpha=0.8, edgecolor='black', linewidth=1.5)
     
-    # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
+    # Add value labels on bars (categorical bars are centred on 0..n-1)
+    value_labels = [f'{v:.1f}ms' for v in ordered_data]
+    for xi, height, label in zip(x, ordered_data, value_labels):
         if height > 0:
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}ms',
+            ax.text(xi, height, label,
                     ha='center', va='bottom', fontweight='bold', fontsize=10)
     
-    # Add overhead percentages
-    baseline_avg = ordered_data[0] if ordered_data[0] > 0 else 1
-    for i, (tier, avg) in enumerate(zip(tier_labels[1:], ordered_data[1:]), 1):
-        if avg > 0:
-            overhead = ((avg - baseline_avg) / baseline_avg) * 100
-            ax.text(i, avg + max(ordered_data)*0.05, f'(+{overhead:.0f}%)', 
-                    ha='center', va='bottom', color='red', fontsize=9, fontweight='bold')
+    # Add overhead percentages, offset in points to clear the value label
+    overhead_labels = [f'(+{o:.0f}%)' for o in data.overheads[1:]]
+    for xi, avg, overhead, label in zip(x[1:], ordered_data[1:], data.overheads[1:], overhead_labels):
+        if avg > 0 and not np.isnan(overhead):
+            ax.annotate(label, (xi, avg), xytext=(0, 13), textcoords='offset points',
+                        ha='center', va='bottom', color='red', fontsize=9, fontweight='bold')
     
     ax.set_ylabel('Average Latency (ms)', fontweight='bold', fontsize=12)
     ax.set_xlabel('Security Tier', fontweight='bold', fontsize=12)
@@ -86,91 +211,68 @@ def create_average_latency_comparison(summary, output_dir):
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     ax.set_ylim(0, max(ordered_data) * 1.25)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/avg_latency_comparison.png', dpi=300, bbox_inches='tight')
-    plt.savefig(f'{output_dir}/avg_latency_comparison.pdf', bbox_inches='tight')
-    print(f"✅ Generated: avg_latency_comparison.png")
-    plt.close()
+    fig.tight_layout()
+    _save_figure(fig, output_dir, 'avg_latency_comparison', formats, dpi)
 
-def create_percentile_comparison(summary, output_dir):
+def create_percentile_comparison(fig, data, output_dir, formats, dpi):
     """Create grouped bar chart for percentile comparison"""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig.clear()
+    fig.set_size_inches(12, 6)
+    ax = fig.add_subplot(111)
     
-    tier_labels = ['Baseline', 'Zero Trust', 'Context-Aware', 'Privacy-Preserving']
-    tier_order = ['baseline', 'zeroTrust', 'contextAware', 'privacyPreserving']
-    
-    x = np.arange(len(tier_labels))
+    x = np.arange(len(TIER_LABELS))
     width = 0.2
     
-    # Extract data in order
-    medians = [summary[summary['Tier'] == t]['Median'].values[0] if len(summary[summary['Tier'] == t]) > 0 else 0 for t in tier_order]
-    p95s = [summary[summary['Tier'] == t]['P95'].values[0] if len(summary[summary['Tier'] == t]) > 0 else 0 for t in tier_order]
-    p99s = [summary[summary['Tier'] == t]['P99'].values[0] if len(summary[summary['Tier'] == t]) > 0 else 0 for t in tier_order]
-    
-    metrics = [
-        ('Median', medians, '#3498db'),
-        ('P95', p95s, '#f39c12'),
-        ('P99', p99s, '#e74c3c')
+    series = [
+        ('Median', data.medians, '#3498db'),
+        ('P95', data.p95s, '#f39c12'),
+        ('P99', data.p99s, '#e74c3c')
     ]
     
-    for i, (label, values, color) in enumerate(metrics):
-        offset = (i - 1) * width
-        bars = ax.bar(x + offset, values, width, label=label, color=color, alpha=0.8, edgecolor='black')
+    for i, (label, values, color) in enumerate(series):
+        xs = x + (i - 1) * width
+        ax.bar(xs, values, width, label=label, color=color, alpha=0.8, edgecolor='black')
         
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
+        labels = [f'{v:.1f}' for v in values]
+        for xi, height, text in zip(xs, values, labels):
             if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.1f}',
+                ax.text(xi, height, text,
                         ha='center', va='bottom', fontsize=8)
     
     ax.set_ylabel('Latency (ms)', fontweight='bold', fontsize=12)
     ax.set_xlabel('Security Tier', fontweight='bold', fontsize=12)
     ax.set_title('Latency Distribution Across Security Tiers', fontweight='bold', fontsize=14, pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels(tier_labels)
+    ax.set_xticklabels(TIER_LABELS)
     ax.legend(title='Percentile', loc='upper left', fontsize=10)
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/percentile_comparison.png', dpi=300, bbox_inches='tight')
-    plt.savefig(f'{output_dir}/percentile_comparison.pdf', bbox_inches='tight')
-    print(f"✅ Generated: percentile_comparison.png")
-    plt.close()
+    fig.tight_layout()
+    _save_figure(fig, output_dir, 'percentile_comparison', formats, dpi)
 
-def create_overhead_breakdown(summary, output_dir):
+def create_overhead_breakdown(fig, data, output_dir, formats, dpi):
     """Create stacked bar chart showing overhead contribution"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    tier_order = ['baseline', 'zeroTrust', 'contextAware', 'privacyPreserving']
-    avgs = [summary[summary['Tier'] == t]['Average'].values[0] if len(summary[summary['Tier'] == t]) > 0 else 0 for t in tier_order]
+    fig.clear()
+    fig.set_size_inches(10, 6)
+    ax = fig.add_subplot(111)
     
-    baseline = avgs[0]
-    zt_overhead = avgs[1] - baseline
-    ca_change = avgs[2] - avgs[1]
-    privacy_overhead = avgs[3] - avgs[2]
+    baseline = data.avgs[0]
     
     categories = ['Zero Trust\nOverhead', 'Context-Aware\nChange', 'Privacy\nOverhead']
-    values = [zt_overhead, ca_change, privacy_overhead]
-    colors = ['#e74c3c', '#f39c12' if ca_change >= 0 else '#2ecc71', '#9b59b6']
+    values = [data.zt_overhead, data.ca_change, data.privacy_overhead]
+    colors = ['#e74c3c', '#f39c12' if data.ca_change >= 0 else '#2ecc71', '#9b59b6']
     
-    bars = ax.bar(categories, values, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
+    ax.bar(categories, values, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
     
     # Add baseline reference line
     ax.axhline(y=0, color='black', linestyle='--', linewidth=1.5, label=f'Baseline ({baseline:.1f}ms)')
     
     # Add value labels
-    for bar, val in zip(bars, values):
-        height = bar.get_height()
-        label = f'{abs(val):.1f}ms'
-        if val < 0:
-            label = f'-{abs(val):.1f}ms'
-            y_pos = height - abs(height)*0.1
-        else:
-            y_pos = height / 2
-        
-        ax.text(bar.get_x() + bar.get_width()/2., y_pos,
+    labels = [f'{v:.1f}ms' for v in values]
+    for xi, (val, label) in enumerate(zip(values, labels)):
+        y_pos = val - abs(val)*0.1 if val < 0 else val / 2
+        ax.text(xi, y_pos,
                 label, ha='center', va='center', fontweight='bold', 
                 color='white', fontsize=11,
                 bbox=dict(boxstyle='round,pad=0.3', facecolor='black', alpha=0.7))
@@ -180,32 +282,25 @@ def create_overhead_breakdown(summary, output_dir):
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     ax.legend(loc='upper left')
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/overhead_breakdown.png', dpi=300, bbox_inches='tight')
-    plt.savefig(f'{output_dir}/overhead_breakdown.pdf', bbox_inches='tight')
-    print(f"✅ Generated: overhead_breakdown.png")
-    plt.close()
+    fig.tight_layout()
+    _save_figure(fig, output_dir, 'overhead_breakdown', formats, dpi)
 
-def create_throughput_comparison(summary, output_dir):
+def create_throughput_comparison(fig, data, output_dir, formats, dpi):
     """Create bar chart showing throughput (req/s)"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    tier_labels = ['Baseline', 'Zero Trust', 'Context-Aware', 'Privacy-Preserving']
-    tier_order = ['baseline', 'zeroTrust', 'contextAware', 'privacyPreserving']
-    colors = ['#2ecc71', '#3498db', '#f39c12', '#e74c3c']
+    fig.clear()
+    fig.set_size_inches(10, 6)
+    ax = fig.add_subplot(111)
     
-    # Calculate throughput as 1000 / avg_latency (requests per second)
-    avgs = [summary[summary['Tier'] == t]['Average'].values[0] if len(summary[summary['Tier'] == t]) > 0 else 0 for t in tier_order]
-    throughput = [1000 / avg if avg > 0 else 0 for avg in avgs]
+    throughput = data.throughput
+    x = np.arange(len(TIER_LABELS))
     
-    bars = ax.bar(tier_labels, throughput, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
+    ax.bar(TIER_LABELS, throughput, color=TIER_COLORS, alpha=0.8, edgecolor='black', linewidth=1.5)
     
     # Add value labels
-    for bar in bars:
-        height = bar.get_height()
+    labels = [f'{v:.1f}' for v in throughput]
+    for xi, height, label in zip(x, throughput, labels):
         if height > 0:
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}',
+            ax.text(xi, height, label,
                     ha='center', va='bottom', fontweight='bold', fontsize=10)
     
     ax.set_ylabel('Throughput (requests/second)', fontweight='bold', fontsize=12)
@@ -214,90 +309,95 @@ def create_throughput_comparison(summary, output_dir):
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     ax.set_ylim(0, max(throughput) * 1.2)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/throughput_comparison.png', dpi=300, bbox_inches='tight')
-    plt.savefig(f'{output_dir}/throughput_comparison.pdf', bbox_inches='tight')
-    print(f"✅ Generated: throughput_comparison.png")
-    plt.close()
+    fig.tight_layout()
+    _save_figure(fig, output_dir, 'throughput_comparison', formats, dpi)
 
-def create_min_max_range_plot(summary, output_dir):
+def create_min_max_range_plot(fig, data, output_dir, formats, dpi):
     """Create plot showing min/max ranges"""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig.clear()
+    fig.set_size_inches(12, 6)
+    ax = fig.add_subplot(111)
     
-    tier_labels = ['Baseline', 'Zero Trust', 'Context-Aware', 'Privacy-Preserving']
-    tier_order = ['baseline', 'zeroTrust', 'contextAware', 'privacyPreserving']
-    colors = ['#2ecc71', '#3498db', '#f39c12', '#e74c3c']
-    
-    x = np.arange(len(tier_labels))
-    
-    for i, (tier, color) in enumerate(zip(tier_order, colors)):
-        row = summary[summary['Tier'] == tier]
-        if len(row) > 0:
-            avg = row['Average'].values[0]
-            min_val = row['Min'].values[0]
-            max_val = row['Max'].values[0]
-            
+    x = np.arange(len(TIER_LABELS))
+    for i, (avg, min_val, max_val, color) in enumerate(zip(data.avgs, data.mins, data.maxs, TIER_COLORS)):
+        if data.present[i]:
             # Plot range as error bar
             ax.errorbar(i, avg, yerr=[[avg-min_val], [max_val-avg]], 
                        fmt='o', color=color, markersize=10, capsize=5, capthick=2,
-                       linewidth=2, alpha=0.8, label=tier_labels[i])
+                       linewidth=2, alpha=0.8, label=TIER_LABELS[i])
     
     ax.set_xticks(x)
-    ax.set_xticklabels(tier_labels)
+    ax.set_xticklabels(TIER_LABELS)
     ax.set_ylabel('Latency (ms)', fontweight='bold', fontsize=12)
     ax.set_xlabel('Security Tier', fontweight='bold', fontsize=12)
     ax.set_title('Latency Range (Min, Average, Max)', fontweight='bold', fontsize=14, pad=20)
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     ax.legend(loc='upper left')
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/latency_range.png', dpi=300, bbox_inches='tight')
-    plt.savefig(f'{output_dir}/latency_range.pdf', bbox_inches='tight')
-    print(f"✅ Generated: latency_range.png")
-    plt.close()
+    fig.tight_layout()
+    _save_figure(fig, output_dir, 'latency_range', formats, dpi)
 
-def generate_summary_table(summary, output_dir):
+def generate_summary_table(data, output_dir):
     """Generate LaTeX table for report"""
-    tier_order = ['baseline', 'zeroTrust', 'contextAware', 'privacyPreserving']
-    tier_names = ['Baseline', 'Zero Trust', 'Context-Aware', 'Privacy-Preserving']
-    
-    latex_table = """\\begin{table}[h]
-\\centering
-\\caption{Performance Metrics Across Security Tiers}
-\\label{tab:performance}
-\\begin{tabular}{|l|r|r|r|r|r|}
-\\hline
-\\textbf{Tier} & \\textbf{Avg (ms)} & \\textbf{Median (ms)} & \\textbf{P95 (ms)} & \\textbf{P99 (ms)} & \\textbf{Overhead} \\\\
-\\hline
-"""
+    lines = [
+        "\\begin{table}[h]",
+        "\\centering",
+        "\\caption{Performance Metrics Across Security Tiers}",
+        "\\label{tab:performance}",
+        "\\begin{tabular}{|l|r|r|r|r|r|}",
+        "\\hline",
+        "\\textbf{Tier} & \\textbf{Avg (ms)} & \\textbf{Median (ms)} & \\textbf{P95 (ms)} & \\textbf{P99 (ms)} & \\textbf{Overhead} \\\\",
+        "\\hline",
+    ]
     
-    baseline_avg = summary[summary['Tier'] == 'baseline']['Average'].values[0]
-    
-    for i, (tier, tier_name) in enumerate(zip(tier_order, tier_names)):
-        row = summary[summary['Tier'] == tier]
-        if len(row) > 0:
-            avg = row['Average'].values[0]
-            med = row['Median'].values[0]
-            p95 = row['P95'].values[0]
-            p99 = row['P99'].values[0]
-            
-            overhead = '---' if i == 0 else f"+{((avg - baseline_avg) / baseline_avg * 100):.1f}\\%"
-            latex_table += f"{tier_name} & {avg:.2f} & {med:.2f} & {p95:.2f} & {p99:.2f} & {overhead} \\\\\n"
-    
-    latex_table += """\\hline
-\\end{tabular}
-\\end{table}
-"""
+    rows = zip(TIER_LABELS, data.avgs, data.medians, data.p95s, data.p99s, data.overheads)
+    for i, (tier_name, avg, med, p95, p99, overhead_pct) in enumerate(rows):
+        if data.present[i]:
+            if i == 0:
+                overhead = '---'
+            elif np.isnan(overhead_pct):
+                overhead = 'n/a'
+            else:
+                overhead = f"+{overhead_pct:.1f}\\%"
+            lines.append(f"{tier_name} & {avg:.2f} & {med:.2f} & {p95:.2f} & {p99:.2f} & {overhead} \\\\")
+    
+    lines += ["\\hline", "\\end{tabular}", "\\end{table}"]
+    latex_table = "\n".join(lines) + "\n"
     
     with open(f'{output_dir}/performance_table.tex', 'w') as f:
         f.write(latex_table)
     
     print(f"✅ Generated: performance_table.tex (LaTeX)")
 
-def main():
-    """Main visualization pipeline"""
-    if len(sys.argv) < 2:
-        print("Usage: python visualize.py <benchmark_results.csv>")
+def _positive_int(value):
+    """argparse type for strictly positive integers"""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+def main(argv=None, tier_rows=None):
+    """Main visualization pipeline
+
+    Programmatic callers may pass already loaded ``tier_rows`` (as
+    returned by load_data) to skip reading the CSV.
+    """
+    parser = argparse.ArgumentParser(description='Generate benchmark charts and LaTeX table')
+    parser.add_argument('summary_file', nargs='?',
+                        help='combined benchmark CSV (default: newest benchmark_results_*.csv)')
+    parser.add_argument('--format', choices=sorted(OUTPUT_FORMATS), default='png',
+                        help='figure format(s) to write (default: png)')
+    parser.add_argument('--dpi', type=_positive_int, default=300,
+                        help='PNG resolution (default: 300; lower for quick previews/CI)')
+    parser.add_argument('--draft', dest='dpi', action='store_const', const=100,
+                        help='shorthand for --dpi 100')
+    args = parser.parse_args(argv)
+    formats = OUTPUT_FORMATS[args.format]
+    
+    if tier_rows is not None:
+        summary_file = '(preloaded)'
+    elif args.summary_file is None:
+        parser.print_usage()
         print("\nSearching for CSV files in current directory...")
         csv_files = list(Path('.').glob('benchmark_results_*.csv'))
         if not csv_files:
@@ -306,52 +406,63 @@ def main():
         summary_file = str(sorted(csv_files)[-1])
         print(f"✅ Using: {summary_file}")
     else:
-        summary_file = sys.argv[1]
+        summary_file = args.summary_file
     
     print(f"\n📊 Healthcare Zero Trust Performance Visualization")
     print(f"Summary file: {summary_file}")
     
     # Load data
-    print("\n📥 Loading data...")
-    summary = load_data(summary_file)
+    if tier_rows is None:
+        print("\n📥 Loading data...")
+        tier_rows = load_data(summary_file)
+    data = build_plot_data(tier_rows)
     
     # Create output directory
     output_dir = Path('visualizations')
     output_dir.mkdir(exist_ok=True)
     print(f"\n📁 Saving visualizations to: {output_dir}/")
     
-    # Generate all visualizations
+    # Generate all visualizations; each chart is independent and dominated
+    # by rasterisation, so render them in parallel worker processes
     print("\n🎨 Generating visualizations...")
-    create_average_latency_comparison(summary, output_dir)
-    create_percentile_comparison(summary, output_dir)
-    create_overhead_breakdown(summary, output_dir)
-    create_throughput_comparison(summary, output_dir)
-    create_min_max_range_plot(summary, output_dir)
-    generate_summary_table(summary, output_dir)
+    plotters = [
+        create_average_latency_comparison,
+        create_percentile_comparison,
+        create_overhead_breakdown,
+        create_throughput_comparison,
+        create_min_max_range_plot,
+    ]
+    workers = min(len(plotters), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_configure_plotting) as executor:
+            futures = [executor.submit(_render, plot, data, output_dir, formats, args.dpi) for plot in plotters]
+            generate_summary_table(data, output_dir)
+            for future in futures:
+                future.result()
+    else:
+        # Single core: worker start-up (re-importing matplotlib) would only add cost
+        _configure_plotting()
+        for plot in plotters:
+            _render(plot, data, output_dir, formats, args.dpi)
+        generate_summary_table(data, output_dir)
     
     print(f"\n✅ All visualizations generated successfully!")
     print(f"\n📁 Files available in: {output_dir}/")
-    print(f"   - PNG files (for reports/presentations)")
-    print(f"   - PDF files (high-quality vector graphics)")
+    if 'png' in formats:
+        print(f"   - PNG files (for reports/presentations)")
+    if 'pdf' in formats:
+        print(f"   - PDF files (high-quality vector graphics)")
     print(f"   - LaTeX table (for academic papers)")
     
     # Print summary statistics
     print("\n📊 Summary Statistics:")
-    print("=" * 70)
-    
-    tier_order = ['baseline', 'zeroTrust', 'contextAware', 'privacyPreserving']
-    tier_names = ['Baseline', 'Zero Trust', 'Context-Aware', 'Privacy-Preserving']
-    
-    baseline_avg = summary[summary['Tier'] == 'baseline']['Average'].values[0]
-    
-    for tier, tier_name in zip(tier_order, tier_names):
-        row = summary[summary['Tier'] == tier]
-        if len(row) > 0:
-            avg = row['Average'].values[0]
-            overhead = 0 if tier == 'baseline' else ((avg - baseline_avg) / baseline_avg * 100)
-            print(f"{tier_name:20s}: {avg:6.2f}ms avg  (overhead: {overhead:+5.1f}%)")
-    
-    print("=" * 70)
+    stats = zip(TIER_LABELS, data.avgs, data.overheads, data.present)
+    lines = [
+        f"{tier_name:20s}: {avg:6.2f}ms avg  (overhead: "
+        f"{'  n/a' if np.isnan(overhead) else f'{overhead:+5.1f}%'})"
+        for tier_name, avg, overhead, present in stats if present
+    ]
+    print("\n".join(["=" * 70, *lines, "=" * 70]))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file